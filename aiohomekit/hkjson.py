@@ -15,9 +15,15 @@
 #
 
 import json
+from typing import Any
 
 import commentjson
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 def loads(s):
     """Load json or fallback to commentjson.
@@ -36,3 +42,38 @@ def loads(s):
         return json.loads(s)
     except json.JSONDecodeError:
         return commentjson.loads(s)
+
+
+def loads_bytes(data: bytes) -> Any:
+    """Load strict json from bytes.
+
+    This deliberately uses the built-in json rather than orjson. orjson
+    silently turns integers wider than 64 bits into floats, which would
+    lose precision, and this can't be detected after the fact.
+    """
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Encode obj as compact json bytes.
+
+    Uses orjson when it is installed as it is considerably
+    faster at encoding large accessory databases. Anything
+    orjson can't encode (such as integers wider than 64 bits)
+    is retried with the built-in json using matching separators.
+
+    The two encoders differ on non-finite floats: orjson
+    writes NaN and Infinity as null, while the built-in json
+    writes them as the non-standard NaN and Infinity.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """Encode obj as a compact json string."""
+    return dumps_bytes(obj).decode("utf-8")
@@ -14,9 +14,11 @@
 # limitations under the License.
 #
 
-import json
-from typing import Any, Dict, Iterable, List, Optional
+import asyncio
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import aiohomekit.hkjson as hkjson
 from aiohomekit.protocol.statuscodes import to_status_code
 
 from .categories import Categories
@@ -38,16 +40,46 @@ __all__ = [
     "Accessory",
 ]
 
+_MISSING = object()
+
+# Controllers resolve the same handful of service names over and over
+_get_service_uuid = lru_cache(maxsize=256)(ServicesTypes.get_uuid)
+
+# Maps optional keys in a HAP characteristic dict to Characteristic kwargs
+_CHAR_KEY_MAP = (
+    ("format", "format"),
+    ("description", "description"),
+    ("minValue", "min_value"),
+    ("maxValue", "max_value"),
+    ("valid-values", "valid_values"),
+    ("unit", "unit"),
+    ("minStep", "min_step"),
+    ("maxLen", "max_len"),
+)
+
+
+def _read_bytes(path) -> bytes:
+    with open(path, "rb") as fp:
+        return fp.read()
+
 
 class Services:
+    __slots__ = ("_services", "_iid_index", "_type_cache")
+
     def __init__(self):
         self._services: List[Service] = []
+        self._iid_index: Dict[int, Service] = {}
+        self._type_cache: Dict[str, Tuple[Service, ...]] = {}
 
     def __iter__(self):
         return iter(self._services)
 
     def iid(self, iid: int) -> Service:
-        return next(filter(lambda service: service.iid == iid, self._services))
+        try:
+            return self._iid_index[iid]
+        except KeyError:
+            # Callers historically got StopIteration from next(filter(...))
+            raise StopIteration from None
 
     def filter(
         self,
@@ -58,23 +90,22 @@ class Services:
         child_service: Service = None,
         order_by: Optional[List[str]] = None,
     ) -> Iterable[Service]:
-        matches = iter(self._services)
-
         if service_type:
-            service_type = ServicesTypes.get_uuid(service_type)
-            matches = filter(lambda service: service.type == service_type, matches)
-
-        if characteristics:
-            for characteristic, value in characteristics.items():
-                matches = filter(
-                    lambda service: service.value(characteristic) == value, matches
-                )
+            candidates = self._of_type(_get_service_uuid(service_type))
+        else:
+            candidates = self._services
 
-        if parent_service:
-            matches = filter(lambda service: service in parent_service.linked, matches)
+        char_items = tuple(characteristics.items()) if characteristics else ()
 
-        if child_service:
-            matches = filter(lambda service: child_service in service.linked, matches)
+        matches = (
+            service
+            for service in candidates
+            if all(
+                service.value(char_type) == value for char_type, value in char_items
+            )
+            and (not parent_service or service in parent_service.linked)
+            and (not child_service or child_service in service.linked)
+        )
 
         if order_by:
             matches = sorted(
@@ -94,23 +125,52 @@ class Services:
         parent_service: Service = None,
         child_service: Service = None,
     ) -> Service:
+        if service_type and not (characteristics or parent_service or child_service):
+            return self.first_of_type(service_type)
+
+        return next(
+            self.filter(
+                service_type=service_type,
+                characteristics=characteristics,
+                parent_service=parent_service,
+                child_service=child_service,
+            ),
+            None,
+        )
+
+    def first_of_type(self, service_type: str) -> Optional[Service]:
+        """Return the first service of service_type, or None."""
+        matches = self._of_type(_get_service_uuid(service_type))
+        return matches[0] if matches else None
+
+    def _of_type(self, service_type: str) -> Tuple[Service, ...]:
+        """Return all services with the (full UUID) service_type, cached."""
         try:
-            return next(
-                self.filter(
-                    service_type=service_type,
-                    characteristics=characteristics,
-                    parent_service=parent_service,
-                    child_service=child_service,
-                )
-            )
-        except StopIteration:
-            return None
+            return self._type_cache[service_type]
+        except KeyError:
+            pass
+        matches = tuple(s for s in self._services if s.type == service_type)
+        self._type_cache[service_type] = matches
+        return matches
 
     def append(self, service: Service):
         self._services.append(service)
+        # First match wins for duplicate iids, as with a linear scan
+        self._iid_index.setdefault(service.iid, service)
+        self._type_cache.clear()
+
+    def _register_iid(self, service: Service, old_iid: int) -> None:
+        """Re-index after the iid of one of our services has changed."""
+        if self._iid_index.get(old_iid) is service or service in self._services:
+            index: Dict[int, Service] = {}
+            for s in self._services:
+                index.setdefault(s.iid, s)
+            self._iid_index = index
 
 
 class Characteristics:
+    __slots__ = ("_services",)
+
     def __init__(self, services):
         self._services = services
 
@@ -123,11 +183,25 @@ class Characteristics:
 
 
 class Accessory:
+    __slots__ = ("_aid", "_next_id", "services", "characteristics", "_parent")
+
     def __init__(self):
-        self.aid = get_id()
+        self._aid = get_id()
         self._next_id = 0
         self.services = Services()
         self.characteristics = Characteristics(self.services)
+        self._parent: Optional["Accessories"] = None
+
+    @property
+    def aid(self) -> int:
+        return self._aid
+
+    @aid.setter
+    def aid(self, aid: int) -> None:
+        old_aid = self._aid
+        self._aid = aid
+        if self._parent is not None:
+            self._parent._register_aid(self, old_aid)
 
     @classmethod
     def create_with_info(
@@ -186,42 +260,43 @@ class Accessory:
         accessory = cls()
         accessory.aid = data["aid"]
 
+        pending_links: List[Tuple[Service, int]] = []
+
+        append_service = accessory.services.append
+
         for service_data in data["services"]:
-            service = accessory.add_service(service_data["type"], add_required=False)
+            service = Service(accessory, service_data["type"], add_required=False)
+            # Set the real iid before indexing, the provisional one from
+            # get_next_id() can collide with a service parsed earlier
             service.iid = service_data["iid"]
+            append_service(service)
+
+            for linked_service in service_data.get("linked", ()):
+                pending_links.append((service, linked_service))
+
+            add_char = service.add_char_from_mapping
 
             for char_data in service_data["characteristics"]:
                 kwargs = {
                     "perms": char_data["perms"],
                 }
-                if "format" in char_data:
-                    kwargs["format"] = char_data["format"]
-                if "description" in char_data:
-                    kwargs["description"] = char_data["description"]
-                if "minValue" in char_data:
-                    kwargs["min_value"] = char_data["minValue"]
-                if "maxValue" in char_data:
-                    kwargs["max_value"] = char_data["maxValue"]
-                if "valid-values" in char_data:
-                    kwargs["valid_values"] = char_data["valid-values"]
-                if "unit" in char_data:
-                    kwargs["unit"] = char_data["unit"]
-                if "minStep" in char_data:
-                    kwargs["min_step"] = char_data["minStep"]
-                if "maxLen" in char_data:
-                    kwargs["max_len"] = char_data["maxLen"]
-
-                char = service.add_char(char_data["type"], **kwargs)
+                get = char_data.get
+                for src, dst in _CHAR_KEY_MAP:
+                    value = get(src, _MISSING)
+                    if value is not _MISSING:
+                        kwargs[dst] = value
+
+                char = add_char(char_data["type"], kwargs)
                 char.iid = char_data["iid"]
 
                 if char_data.get("value") is not None:
                     char.set_value(char_data["value"])
 
-        for service_data in data["services"]:
-            for linked_service in service_data.get("linked", []):
-                accessory.services.iid(service_data["iid"]).add_linked_service(
-                    accessory.services.iid(linked_service)
-                )
+        # Links can point at services declared later in the list. A dangling
+        # link raises StopIteration from Services.iid, as it always has.
+        services_iid = accessory.services.iid
+        for service, linked_service in pending_links:
+            service.add_linked_service(services_iid(linked_service))
 
         return accessory
 
@@ -237,16 +312,18 @@ class Accessory:
         return service
 
     def to_accessory_and_service_list(self):
-        services_list = []
-        for s in self.services:
-            services_list.append(s.to_accessory_and_service_list())
-        d = {"aid": self.aid, "services": services_list}
-        return d
+        return {
+            "aid": self.aid,
+            "services": [s.to_accessory_and_service_list() for s in self.services],
+        }
 
 
 class Accessories:
+    __slots__ = ("accessories", "_aid_index")
+
     def __init__(self) -> None:
         self.accessories = []
+        self._aid_index: Dict[int, Accessory] = {}
 
     def __iter__(self):
         return iter(self.accessories)
@@ -256,8 +333,16 @@ class Accessories:
 
     @classmethod
     def from_file(cls, path) -> "Accessories":
-        with open(path) as fp:
-            return cls.from_list(json.load(fp))
+        return cls.from_list(hkjson.loads_bytes(_read_bytes(path)))
+
+    @classmethod
+    async def from_files(cls, paths: Iterable[str]) -> List["Accessories"]:
+        """Load several accessory dumps, reading the files concurrently."""
+        loop = asyncio.get_event_loop()
+        datas = await asyncio.gather(
+            *(loop.run_in_executor(None, _read_bytes, path) for path in paths)
+        )
+        return [cls.from_list(hkjson.loads_bytes(data)) for data in datas]
 
     @classmethod
     def from_list(cls, accessories) -> "Accessories":
@@ -266,25 +351,56 @@ class Accessories:
             self.add_accessory(Accessory.create_from_dict(accessory))
         return self
 
+    @property
+    def frozen(self) -> bool:
+        return isinstance(self.accessories, tuple)
+
+    def freeze(self) -> None:
+        """
+        Seal the list of accessories once the database is fully loaded.
+
+        The accessories are stored as a tuple from then on, so iteration is a
+        little cheaper and later calls to add_accessory raise. Characteristic
+        values can still be updated.
+        """
+        self.accessories = tuple(self.accessories)
+
     def add_accessory(self, accessory: Accessory) -> None:
+        if self.frozen:
+            raise RuntimeError("Cannot add an accessory to a frozen Accessories")
         self.accessories.append(accessory)
+        # First match wins for duplicate aids, as with a linear scan
+        self._aid_index.setdefault(accessory.aid, accessory)
+        accessory._parent = self
+
+    def _register_aid(self, accessory: Accessory, old_aid: int) -> None:
+        """Re-index after the aid of one of our accessories has changed."""
+        if self._aid_index.get(old_aid) is accessory or accessory in self.accessories:
+            index: Dict[int, Accessory] = {}
+            for a in self.accessories:
+                index.setdefault(a.aid, a)
+            self._aid_index = index
 
     def serialize(self):
-        accessories_list = []
-        for a in self.accessories:
-            accessories_list.append(a.to_accessory_and_service_list())
-        return accessories_list
+        return [a.to_accessory_and_service_list() for a in self.accessories]
 
-    def to_accessory_and_service_list(self):
+    def to_accessory_and_service_list(self) -> str:
+        return self.to_accessory_and_service_list_bytes().decode("utf-8")
+
+    def to_accessory_and_service_list_bytes(self) -> bytes:
         d = {"accessories": self.serialize()}
-        return json.dumps(d)
+        return hkjson.dumps_bytes(d)
 
     def aid(self, aid) -> Accessory:
-        return next(filter(lambda accessory: accessory.aid == aid, self.accessories))
+        try:
+            return self._aid_index[aid]
+        except KeyError:
+            # Callers historically got StopIteration from next(filter(...))
+            raise StopIteration from None
 
     def process_changes(self, changes):
         for ((aid, iid), value) in changes.items():
-            accessory = self.aid(aid)
+            accessory = self._aid_index.get(aid)
             if not accessory:
                 continue
 
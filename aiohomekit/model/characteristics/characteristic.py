@@ -59,7 +59,19 @@ NUMBER_TYPES = INTEGER_TYPES + [CharacteristicFormats.float]
 
 
 class Characteristic:
-    def __init__(self, service: "Service", characteristic_type: str, **kwargs) -> None:
+    def __init__(
+        self,
+        service: "Service",
+        characteristic_type: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> None:
+        if params is not None:
+            if kwargs:
+                raise TypeError("Pass either params or keyword arguments, not both")
+            kwargs = params
+
         self.service = service
         self.iid = service.accessory.get_next_id()
         try:
@@ -249,13 +261,15 @@ class Characteristic:
         return self.value
 
     def to_accessory_and_service_list(self):
+        perms = self.perms
+        fmt = self.format
         d = {
             "type": self.type,
             "iid": self.iid,
-            "perms": self.perms,
-            "format": self.format,
+            "perms": perms,
+            "format": fmt,
         }
-        if CharacteristicPermissions.paired_read in self.perms:
+        if CharacteristicPermissions.paired_read in perms:
             d["value"] = self._value
         if self.ev:
             d["ev"] = self.ev
@@ -269,7 +283,7 @@ class Characteristic:
             d["maxValue"] = self.maxValue
         if self.minStep is not None:
             d["minStep"] = self.minStep
-        if self.maxLen and self.format in [CharacteristicFormats.string]:
+        if self.maxLen and fmt == CharacteristicFormats.string:
             d["maxLen"] = self.maxLen
         if self.valid_values is not None:
             d["valid-values"] = self.valid_values
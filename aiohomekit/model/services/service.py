@@ -14,7 +14,7 @@
 # limitations under the License.
 #
 
-from typing import TYPE_CHECKING, Iterable, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
 
 from aiohomekit.model.characteristics import Characteristic, CharacteristicsTypes
 from aiohomekit.model.characteristics.characteristic import check_convert_value
@@ -64,7 +64,7 @@ class Service:
             self.type = service_type
 
         self.accessory = accessory
-        self.iid = accessory.get_next_id()
+        self._iid = accessory.get_next_id()
         self.characteristics = Characteristics()
         self.characteristics_by_type = {}
         self.linked = []
@@ -78,6 +78,16 @@ class Service:
                 if required not in self.characteristics_by_type:
                     self.add_char(required)
 
+    @property
+    def iid(self) -> int:
+        return self._iid
+
+    @iid.setter
+    def iid(self, iid: int) -> None:
+        old_iid = self._iid
+        self._iid = iid
+        self.accessory.services._register_iid(self, old_iid)
+
     def has(self, char_type) -> bool:
         try:
             char_type = CharacteristicsTypes.get_uuid(char_type)
@@ -118,7 +128,13 @@ class Service:
         return self.characteristics_by_type[key]
 
     def add_char(self, char_type: str, **kwargs) -> Characteristic:
-        char = Characteristic(self, char_type, **kwargs)
+        return self.add_char_from_mapping(char_type, kwargs)
+
+    def add_char_from_mapping(
+        self, char_type: str, params: Dict[str, Any]
+    ) -> Characteristic:
+        """Like add_char, but takes the characteristic options as a dict."""
+        char = Characteristic(self, char_type, params=params)
         self.characteristics.append(char)
         self.characteristics_by_type[char.type] = char
         return char
@@ -141,18 +157,16 @@ class Service:
         return result
 
     def to_accessory_and_service_list(self):
-        characteristics_list = []
-        for c in self.characteristics:
-            characteristics_list.append(c.to_accessory_and_service_list())
         d = {
             "iid": self.iid,
             "type": self.type,
-            "characteristics": characteristics_list,
+            "characteristics": [
+                c.to_accessory_and_service_list() for c in self.characteristics
+            ],
         }
 
-        linked = [service.iid for service in self.linked]
-        if linked:
-            d["linked"] = linked
+        if self.linked:
+            d["linked"] = [service.iid for service in self.linked]
 
         return d
 
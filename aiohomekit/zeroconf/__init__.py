@@ -234,13 +234,16 @@ def parse_discovery_properties(props: Dict[str, str]) -> Dict[str, Union[str, in
     """
     data = {}
 
+    # Lower case the keys once rather than on every case insensitive lookup
+    props = {k.lower(): v for k, v in props.items()}
+
     # stuff taken from the Bonjour TXT record (see table 5-7 on page 69)
     for prop in ("c#", "id", "md", "s#", "ci", "sf"):
-        prop_val = get_from_properties(props, prop, case_sensitive=False)
+        prop_val = get_from_properties(props, prop)
         if prop_val:
             data[prop] = prop_val
 
-    feature_flags = get_from_properties(props, "ff", case_sensitive=False)
+    feature_flags = get_from_properties(props, "ff")
     if feature_flags:
         flags = int(feature_flags)
     else:
@@ -248,9 +251,7 @@ def parse_discovery_properties(props: Dict[str, str]) -> Dict[str, Union[str, in
     data["ff"] = flags
     data["flags"] = FeatureFlags(flags)
 
-    protocol_version = get_from_properties(
-        props, "pv", case_sensitive=False, default="1.0"
-    )
+    protocol_version = get_from_properties(props, "pv", default="1.0")
     if protocol_version:
         data["pv"] = protocol_version
 
@@ -25,6 +25,7 @@ import socket
 from socketserver import ThreadingMixIn
 import sys
 import threading
+from typing import Optional
 
 from cryptography import exceptions as cryptography_exceptions
 from cryptography.hazmat.primitives import serialization
@@ -91,6 +92,7 @@ class AccessoryServer(ThreadingMixIn, HTTPServer):
         self.zeroconf_info = None
 
         self.accessories = Accessories()
+        self._accessories_bytes: Optional[bytes] = None
 
         HTTPServer.__init__(
             self, (self.data.ip, self.data.port), AccessoryRequestHandler
@@ -110,6 +112,20 @@ class AccessoryServer(ThreadingMixIn, HTTPServer):
 
     def add_accessory(self, accessory):
         self.accessories.add_accessory(accessory)
+        self._accessories_bytes = None
+
+    def get_accessories_bytes(self) -> bytes:
+        """
+        Return the encoded accessory database for GET /accessories.
+
+        The encoding is memoized as controllers fetch it repeatedly; it is
+        dropped whenever a characteristic is written via PUT /characteristics.
+        """
+        if self._accessories_bytes is None:
+            self._accessories_bytes = (
+                self.accessories.to_accessory_and_service_list_bytes()
+            )
+        return self._accessories_bytes
 
     def set_identify_callback(self, func):
         """
@@ -798,6 +814,7 @@ class AccessoryRequestHandler(BaseHTTPRequestHandler):
                                     characteristic_to_set["value"]
                                 )
                                 characteristic.set_value(new_val)
+                                self.server._accessories_bytes = None
                                 result["characteristics"].append(
                                     {"aid": aid, "iid": cid, "status": 0}
                                 )
@@ -872,7 +889,7 @@ class AccessoryRequestHandler(BaseHTTPRequestHandler):
 
     def _get_accessories(self):
 
-        result_bytes = self.server.accessories.to_accessory_and_service_list().encode()
+        result_bytes = self.server.get_accessories_bytes()
         self.send_response(HttpStatusCodes.OK)
         self.send_header("Content-Type", "application/hap+json")
         self.send_header("Content-Length", len(result_bytes))
@@ -3,16 +3,11 @@ import errno
 import logging
 import os
 import socket
-import sys
 import tempfile
 import threading
 import time
 from unittest import mock
-
-if sys.version_info[:2] < (3, 8):
-    from asynctest.mock import patch  # noqa
-else:
-    from unittest.mock import patch  # noqa
+from unittest.mock import patch
 
 import pytest
 
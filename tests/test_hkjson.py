@@ -27,3 +27,42 @@ def test_loads_trailing_comma():
             {"aid": 10, "iid": 13, "value": 20.5},
         ]
     }
+
+
+def test_dumps_compact():
+    """Test we encode without whitespace, matching what an iPhone sends."""
+    data = {"characteristics": [{"aid": 2, "iid": 15, "ev": True, "name": "Küche"}]}
+
+    result = hkjson.dumps_bytes(data)
+    assert result == (
+        '{"characteristics":[{"aid":2,"iid":15,"ev":true,"name":"Küche"}]}'.encode()
+    )
+    assert hkjson.dumps(data) == result.decode()
+    assert hkjson.loads(result) == data
+
+
+def test_loads_bytes():
+    """Test we decode bytes."""
+    assert hkjson.loads_bytes(b'{"aid":1,"iid":2}') == {"aid": 1, "iid": 2}
+
+
+def test_loads_bytes_nan():
+    """Test we decode NaN."""
+    result = hkjson.loads_bytes(b'{"value":NaN}')
+    assert result["value"] != result["value"]
+
+
+def test_loads_bytes_big_int():
+    """Test integers wider than 64 bits keep their precision."""
+    result = hkjson.loads_bytes(b'{"big":123456789012345678901234567890}')
+    assert result["big"] == 123456789012345678901234567890
+    assert isinstance(result["big"], int)
+
+
+def test_dumps_bytes_big_int():
+    """Test integers wider than 64 bits can be encoded and read back."""
+    data = {"aid": 1, "value": 123456789012345678901234567890}
+
+    result = hkjson.dumps_bytes(data)
+    assert result == b'{"aid":1,"value":123456789012345678901234567890}'
+    assert hkjson.loads_bytes(result) == data
@@ -15,9 +15,12 @@
 #
 
 import base64
+import json
 
-from aiohomekit.model import Accessories
-from aiohomekit.model.characteristics import CharacteristicsTypes
+import pytest
+
+from aiohomekit.model import Accessories, Accessory
+from aiohomekit.model.characteristics import Characteristic, CharacteristicsTypes
 from aiohomekit.model.characteristics.const import (
     AudioCodecValues,
     BitRateValues,
@@ -43,6 +46,15 @@ from aiohomekit.model.services import ServicesTypes
 from aiohomekit.protocol.statuscodes import HapStatusCode
 
 
+async def test_from_files():
+    hue_bridge, koogeek = await Accessories.from_files(
+        ["tests/fixtures/hue_bridge.json", "tests/fixtures/koogeek_ls1.json"]
+    )
+
+    assert hue_bridge.aid(6623462389072572).name == "Hue dimmer switch"
+    assert koogeek.aid(1).characteristics.iid(8).value is False
+
+
 def test_hue_bridge():
     a = Accessories.from_file("tests/fixtures/hue_bridge.json").aid(6623462389072572)
     assert a.name == "Hue dimmer switch"
@@ -97,6 +109,28 @@ def test_linked_services():
     assert service.linked[0].short_type == ServicesTypes.SERVICE_LABEL
 
 
+def test_first_of_type():
+    a = Accessories.from_file("tests/fixtures/hue_bridge.json").aid(6623462389072572)
+
+    service = a.services.first_of_type(ServicesTypes.STATELESS_PROGRAMMABLE_SWITCH)
+    assert service.iid == 588410585088
+    assert service is a.services.first(
+        service_type=ServicesTypes.STATELESS_PROGRAMMABLE_SWITCH
+    )
+
+    assert a.services.first_of_type(ServicesTypes.LIGHTBULB) is None
+
+
+def test_first_of_type_after_append():
+    a = Accessories.from_file("tests/fixtures/hue_bridge.json").aid(6623462389072572)
+    assert a.services.first_of_type(ServicesTypes.LIGHTBULB) is None
+
+    lightbulb = a.add_service(ServicesTypes.LIGHTBULB)
+
+    assert a.services.first_of_type(ServicesTypes.LIGHTBULB) is lightbulb
+    assert list(a.services.filter(service_type=ServicesTypes.LIGHTBULB)) == [lightbulb]
+
+
 def test_get_by_name():
     name = "Hue dimmer switch button 3"
     a = Accessories.from_file("tests/fixtures/hue_bridge.json").aid(6623462389072572)
@@ -109,6 +143,29 @@ def test_get_by_name():
     assert service[CharacteristicsTypes.NAME].value == name
 
 
+def test_get_by_multiple_characteristics():
+    a = Accessories.from_file("tests/fixtures/hue_bridge.json").aid(6623462389072572)
+
+    service = a.services.first(
+        service_type=ServicesTypes.STATELESS_PROGRAMMABLE_SWITCH,
+        characteristics={
+            CharacteristicsTypes.NAME: "Hue dimmer switch button 3",
+            CharacteristicsTypes.SERVICE_LABEL_INDEX: 3,
+        },
+    )
+    assert service.iid == 588410716160
+
+    # Every characteristic must match, not just the last one given
+    service = a.services.first(
+        service_type=ServicesTypes.STATELESS_PROGRAMMABLE_SWITCH,
+        characteristics={
+            CharacteristicsTypes.NAME: "Hue dimmer switch button 1",
+            CharacteristicsTypes.SERVICE_LABEL_INDEX: 3,
+        },
+    )
+    assert service is None
+
+
 def test_get_by_characteristic_types():
     name = "Hue dimmer switch button 3"
 
@@ -177,6 +234,22 @@ def test_order_by():
     assert buttons[3].value(CharacteristicsTypes.SERVICE_LABEL_INDEX) == 4
 
 
+def test_freeze():
+    accessories = Accessories.from_file("tests/fixtures/hue_bridge.json")
+    aids = [accessory.aid for accessory in accessories]
+    assert not accessories.frozen
+
+    accessories.freeze()
+
+    assert accessories.frozen
+    assert [accessory.aid for accessory in accessories] == aids
+    assert accessories[0].aid == aids[0]
+    assert accessories.aid(1).aid == 1
+
+    with pytest.raises(RuntimeError):
+        accessories.add_accessory(Accessory())
+
+
 def test_process_changes():
     accessories = Accessories.from_file("tests/fixtures/koogeek_ls1.json")
 
@@ -188,6 +261,17 @@ def test_process_changes():
     assert on_char.value is True
 
 
+def test_process_changes_unknown_aid():
+    accessories = Accessories.from_file("tests/fixtures/koogeek_ls1.json")
+
+    on_char = accessories.aid(1).characteristics.iid(8)
+    assert on_char.value is False
+
+    accessories.process_changes({(2, 8): {"value": True}, (1, 8): {"value": True}})
+
+    assert on_char.value is True
+
+
 def test_process_changes_error():
     accessories = Accessories.from_file("tests/fixtures/koogeek_ls1.json")
 
@@ -452,3 +536,135 @@ def test_set_value():
     on_char.value = True
 
     assert on_char.value is True
+
+
+def test_services_iid_lookup():
+    a = Accessories.from_file("tests/fixtures/synthetic_float_minstep.json").aid(1)
+
+    service = a.services.iid(100)
+    assert service.iid == 100
+
+    # The provisional iid assigned before parsing must not stay indexed
+    with pytest.raises(StopIteration):
+        a.services.iid(1)
+
+
+def test_services_iid_lookup_non_contiguous():
+    accessory = Accessory.create_from_dict(
+        {
+            "aid": 1,
+            "services": [
+                {
+                    "iid": 3,
+                    "type": ServicesTypes.ACCESSORY_INFORMATION,
+                    "characteristics": [
+                        {"iid": 4, "type": CharacteristicsTypes.NAME, "perms": ["pr"]}
+                    ],
+                },
+                {
+                    "iid": 10,
+                    "type": ServicesTypes.LIGHTBULB,
+                    "characteristics": [
+                        {"iid": 11, "type": CharacteristicsTypes.ON, "perms": ["pr"]}
+                    ],
+                },
+            ],
+        }
+    )
+
+    assert accessory.services.iid(3).type == ServicesTypes.get_uuid(
+        ServicesTypes.ACCESSORY_INFORMATION
+    )
+    assert accessory.services.iid(10).type == ServicesTypes.get_uuid(
+        ServicesTypes.LIGHTBULB
+    )
+
+
+def test_services_iid_reindexed_on_change():
+    accessory = Accessory()
+    service = accessory.add_service(ServicesTypes.LIGHTBULB)
+    old_iid = service.iid
+
+    service.iid = 50
+
+    assert accessory.services.iid(50) is service
+    with pytest.raises(StopIteration):
+        accessory.services.iid(old_iid)
+
+
+def test_services_iid_duplicates_first_wins():
+    accessory = Accessory()
+    first = accessory.add_service(ServicesTypes.LIGHTBULB)
+    second = accessory.add_service(ServicesTypes.SWITCH)
+
+    second.iid = first.iid
+
+    assert accessory.services.iid(first.iid) is first
+
+
+def test_accessories_aid_reindexed_on_change():
+    accessories = Accessories.from_file("tests/fixtures/koogeek_ls1.json")
+    accessory = accessories.aid(1)
+
+    accessory.aid = 78
+
+    assert accessories.aid(78) is accessory
+    with pytest.raises(StopIteration):
+        accessories.aid(1)
+
+
+def test_dangling_linked_service():
+    with pytest.raises(StopIteration):
+        Accessory.create_from_dict(
+            {
+                "aid": 1,
+                "services": [
+                    {
+                        "iid": 1,
+                        "type": ServicesTypes.ACCESSORY_INFORMATION,
+                        "characteristics": [],
+                        "linked": [2],
+                    }
+                ],
+            }
+        )
+
+
+def test_characteristic_params_and_kwargs():
+    service = Accessory().add_service(ServicesTypes.LIGHTBULB)
+
+    char = Characteristic(service, CharacteristicsTypes.ON, params={"perms": ["pr"]})
+    assert char.perms == ["pr"]
+
+    with pytest.raises(TypeError):
+        Characteristic(
+            service, CharacteristicsTypes.ON, params={"perms": ["pr"]}, format="bool"
+        )
+
+
+def test_accessories_aid_lookup():
+    accessories = Accessories.from_file("tests/fixtures/hue_bridge.json")
+
+    assert accessories.aid(1).aid == 1
+
+    with pytest.raises(StopIteration):
+        accessories.aid(9999)
+
+
+def test_to_accessory_and_service_list():
+    accessories = Accessories.from_file("tests/fixtures/koogeek_ls1.json")
+
+    result = accessories.to_accessory_and_service_list_bytes()
+    assert result.decode() == accessories.to_accessory_and_service_list()
+
+    reloaded = Accessories.from_list(json.loads(result)["accessories"])
+    assert reloaded.serialize() == accessories.serialize()
+
+
+def test_to_accessory_and_service_list_big_int():
+    accessories = Accessories.from_file("tests/fixtures/koogeek_ls1.json")
+    on_char = accessories.aid(1).characteristics.iid(8)
+    on_char.set_value(123456789012345678901234567890)
+
+    result = json.loads(accessories.to_accessory_and_service_list_bytes())
+    assert result == {"accessories": accessories.serialize()}
@@ -15,15 +15,7 @@
 #
 
 import socket
-import sys
-from unittest.mock import MagicMock, PropertyMock, call, patch
-
-if sys.version_info[:2] < (3, 8):
-    from asynctest.mock import CoroutineMock  # noqa
-
-    AsyncMock = CoroutineMock  # noqa: F405
-else:
-    from unittest.mock import AsyncMock  # noqa
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, call, patch
 
 import pytest
 from zeroconf import BadTypeInNameException, Error
@@ -37,6 +29,7 @@ from aiohomekit.zeroconf import (
     async_find_data_for_device_id,
     async_find_device_ip_and_port,
     get_from_properties,
+    parse_discovery_properties,
 )
 
 
@@ -636,3 +629,26 @@ def test_is_homekit_device_case_insensitive():
     )
 
     assert _service_info_is_homekit_device(info)
+
+
+def test_parse_discovery_properties_case_insensitive():
+    props = {
+        "C#": "1",
+        "ID": "00:00:01:00:00:02",
+        "md": "unittest",
+        "S#": "1",
+        "Ci": "5",
+        "sF": "0",
+        "FF": "1",
+        "Pv": "1.1",
+    }
+
+    data = parse_discovery_properties(props)
+
+    assert data["c#"] == "1"
+    assert data["id"] == "00:00:01:00:00:02"
+    assert data["md"] == "unittest"
+    assert data["s#"] == "1"
+    assert data["ff"] == 1
+    assert data["pv"] == "1.1"
+    assert data["category"] == "Lightbulb"